@@ -7,21 +7,273 @@ A package manager and runtime launcher for CLI games in various languages
 import os
 import sys
 import json
+import hashlib
 import subprocess
 import shutil
+import stat
+import tempfile
+import threading
+import time
 import zipfile
 import urllib.request
 import urllib.parse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple, Set
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from blake3 import blake3 as _hasher
+    _HASH_NAME = "blake3"
+except ImportError:
+    _hasher = hashlib.sha256
+    _HASH_NAME = "sha256"
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# game.json fields shown by `clvibe list`
+_LIST_FIELDS = ("name", "author", "version", "lang", "llm")
+
+# str.translate tables for building slugs in a single pass
+_SLUG_TABLE = str.maketrans(" ", "-")
+_VERSION_SLUG_TABLE = str.maketrans("", "", ".")
+
+# Download read size, and minimum seconds between progress redraws
+_DOWNLOAD_CHUNK = 1024 * 1024
+_PROGRESS_INTERVAL = 0.1
+
+# Buffer for zip I/O: extraction copy chunks and backup archive writes
+_ZIP_BUFFER = 1024 * 1024
+
+# Already-compressed formats, stored in backups as-is rather than deflated again
+_STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ogg", ".mp3", ".mp4", ".webm",
+    ".zip", ".gz", ".xz", ".bz2", ".7z", ".woff", ".woff2",
+})
+
+# Fast level-1 DEFLATE for backups; zipfile only accepts a level from Python 3.7
+_ZIP_LEVEL = {"compresslevel": 1} if sys.version_info >= (3, 7) else {}
+
+# Read size when hashing game files for dedupe
+_HASH_CHUNK = 64 * 1024
+
+# Native rm, used by _fast_rmtree, and how many paths to pass it per call
+_RM = shutil.which("rm")
+_RM_BATCH = 1000
+
+# Linux ioctl that makes dst share src's extents (btrfs/xfs reflink)
+_FICLONE = 0x40049409
+
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        import ctypes
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        pass
+
+
+def _load_json(data: bytes):
+    """Parse JSON bytes with orjson when installed, falling back to the stdlib"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_json(data: bytes) -> bytes:
+    """Re-serialize JSON bytes compactly with sorted keys, so equal content hashes equally
+    
+    The stdlib fallback produces the same bytes as orjson's OPT_SORT_KEYS
+    (floats in exponent notation aside), so hashes don't depend on which is used.
+    """
+    if orjson is not None:
+        return orjson.dumps(orjson.loads(data), option=orjson.OPT_SORT_KEYS)
+    return json.dumps(json.loads(data), sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False).encode()
+
+
+def _slugify(text: str) -> str:
+    """Turn a game or author name into a slug"""
+    return text.lower().translate(_SLUG_TABLE)
+
+
+def _game_sort_key(game: Dict) -> str:
+    """Order games the way `clvibe list` numbers them"""
+    return game["name"].lower()
+
+
+def _reflink_or_copy(src, dst):
+    """copytree copy_function that clones files on copy-on-write filesystems
+    
+    Falls back to a regular shutil.copy2 byte copy when cloning isn't supported.
+    Only regular files are cloned; anything else (e.g. a FIFO, which open()
+    would block on) goes to shutil.copy2, which rejects special files.
+    """
+    try:
+        regular = stat.S_ISREG(os.stat(src).st_mode)
+    except OSError:
+        regular = False
+    
+    if regular and fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                except OSError:
+                    # No reflink support; copy_file_range still copies in-kernel
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except (OSError, AttributeError):
+            pass
+    elif regular and _clonefile is not None:
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return dst
+    
+    return shutil.copy2(src, dst)
+
+
+def _fast_rmtree(*paths):
+    """Remove directory trees (or files), handing them all to one native rm on POSIX
+    
+    rm -rf unlinks from C without a Python call per file. Paths that don't
+    exist are ignored. Anything still there afterwards - on Windows, or if
+    rm is missing or fails - is removed with shutil.rmtree/os.unlink, so
+    errors still surface as Python exceptions.
+    """
+    if os.name == "posix" and _RM is not None:
+        for i in range(0, len(paths), _RM_BATCH):
+            try:
+                subprocess.run([_RM, "-rf", "--", *map(str, paths[i:i + _RM_BATCH])],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError:
+                pass  # Couldn't run rm; the loop below removes everything
+    
+    for path in paths:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.unlink(path)
+
+
+def _hash_file(path) -> str:
+    """Digest a file's contents with the dedupe hash"""
+    hasher = _hasher()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _hash_entry(digest: str, st: os.stat_result) -> dict:
+    """Hash cache entry for a digest of a file with the given stat"""
+    return {"algo": _HASH_NAME, "mtime": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+
+
+def _cached_hash(entry: Optional[dict], st: os.stat_result) -> Optional[str]:
+    """Cached digest from a hash cache entry, if it's still valid for the given stat"""
+    if (isinstance(entry, dict) and entry.get("algo") == _HASH_NAME
+            and entry.get("mtime") == st.st_mtime_ns and entry.get("size") == st.st_size):
+        return entry.get("hash")
+    return None
+
+
+def _iter_game_jsons(root) -> Iterator[Path]:
+    """Yield every game.json under root, top-down like os.walk
+
+    Uses os.scandir so entry types come from the directory listing itself
+    instead of a stat() per entry.
+    """
+    game_json = None
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name == "game.json":
+                    game_json = entry.path
+    except OSError:
+        return
+    
+    if game_json:
+        yield Path(game_json)
+    for subdir in subdirs:
+        yield from _iter_game_jsons(subdir)
+
+
+def _iter_files(root) -> Iterator[Tuple[str, str]]:
+    """Yield (path, path relative to root) for every file under root"""
+    root = str(root)
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.path[prefix_len:]
+
+
+def _zip_directory(source_dir: Path, zip_path: Path):
+    """Create a zip file from directory (module level so worker processes can run it)"""
+    # zipfile hands compressed data over in small pieces; batch them into big writes
+    with open(zip_path, 'wb', buffering=_ZIP_BUFFER) as fp, \
+            zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                            **_ZIP_LEVEL) as zf:
+        for path, arcname in _iter_files(source_dir):
+            if os.path.splitext(arcname)[1].lower() in _STORED_EXTENSIONS:
+                zf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(path, arcname)
+
+
+def _copy_game(source_dir: Path, dest_dir: Path, zip_path: Path, move: bool = False):
+    """Put a game into place and write its zip backup (module level for worker processes)
+    
+    move=True renames the source into place instead of copying it, for
+    throwaway sources such as extracted collections.
+    """
+    moved = False
+    if move:
+        try:
+            os.rename(source_dir, dest_dir)
+            moved = True
+        except OSError:
+            pass  # e.g. different filesystem - copy instead
+    if not moved:
+        shutil.copytree(source_dir, dest_dir, copy_function=_reflink_or_copy)
+    
+    # Zip the installed copy: copytree follows directory symlinks in the
+    # source, which the zip walker skips, so only the copy has every file
+    _zip_directory(dest_dir, zip_path)
+
+
 class ClvibeManager:
     def __init__(self):
         self.home_dir = Path.home() / ".clvibe"
         self.games_dir = self.home_dir / "games"
         self.zipped_dir = self.home_dir / "zipped"
         self.config_file = self.home_dir / "config.json"
+        self.hash_cache_file = self.home_dir / "hashes.json"
         
         # Language runtime configurations
         self.runtimes = {
@@ -40,6 +292,22 @@ class ClvibeManager:
             "dart": {"cmd": "dart", "ext": ".dart"},
         }
         
+        # Resolved runtime executables (None if missing), probed at most once
+        # per language per run
+        self._runtime_cache = {}
+        
+        # (fields, games_dir mtime, sorted games) from the last _get_all_games
+        self._games_cache = None
+        
+        # (sorted games, by lowercase name, by slug) for that same game list
+        self._game_index = None
+        
+        # (zipped_dir mtime, [(lowercase stem, zip path)] sorted by path)
+        self._zip_index = None
+        
+        # Cached dedupe hashes (see _load_hash_cache); loaded by find_duplicates
+        self._hash_cache = None
+        
         self._ensure_directories()
     
     def _ensure_directories(self):
@@ -56,38 +324,45 @@ class ClvibeManager:
         
         ext = runtime["ext"]
         
+        # One directory listing answers every lookup below
+        try:
+            with os.scandir(game_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return None
+        
         # Common main file names
         main_names = [f"main{ext}", f"index{ext}", f"game{ext}", f"start{ext}"]
         
         for name in main_names:
-            main_file = game_path / name
-            if main_file.exists():
-                return main_file
+            if name in entries:
+                return Path(entries[name].path)
         
         # If not found, search for any file with the right extension
-        files = list(game_path.glob(f"*{ext}"))
-        return files[0] if files else None
+        for name, entry in entries.items():
+            if name.endswith(ext):
+                return Path(entry.path)
+        return None
+    
+    def _resolve_runtime(self, lang: str) -> Optional[str]:
+        """Full path of the runtime executable for a language, or None if it isn't installed"""
+        lang = lang.lower()
+        if lang in self._runtime_cache:
+            return self._runtime_cache[lang]
+        
+        runtime = self.runtimes.get(lang)
+        # A PATH lookup is enough; no need to fork the interpreter
+        executable = shutil.which(runtime["cmd"]) if runtime is not None else None
+        self._runtime_cache[lang] = executable
+        return executable
     
     def _check_runtime(self, lang: str) -> bool:
         """Check if runtime for language is available"""
-        runtime = self.runtimes.get(lang.lower())
-        if not runtime:
-            return False
-        
-        try:
-            subprocess.run(
-                [runtime["cmd"], "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5
-            )
-            return True
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return self._resolve_runtime(lang) is not None
     
     def list_games(self, verbose: bool = False):
         """List all installed games"""
-        games = self._get_all_games()
+        games = self._get_all_games(fields=_LIST_FIELDS)
         
         if not games:
             print("No games installed. Use 'clvibe install <path>' to add games.")
@@ -123,47 +398,120 @@ class ClvibeManager:
                     print(f"      ⚠️  Runtime not available: {self.runtimes.get(lang.lower(), {}).get('cmd', lang)}")
                 print()
     
-    def _get_all_games(self) -> List[Dict]:
-        """Get list of all games with their metadata"""
-        games = []
+    def _read_game_fields(self, game_json: Path, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """Read game.json, keeping only the requested fields (all of them if None)"""
+        metadata = _load_json(game_json.read_bytes())
+        if fields is None:
+            return metadata
+        return {key: metadata[key] for key in fields if key in metadata}
+    
+    def _iter_games(self, fields: Optional[Tuple[str, ...]] = None) -> Iterator[Dict]:
+        """Yield installed games with their metadata, unsorted, as they are found
         
-        for game_dir in self.games_dir.iterdir():
-            if not game_dir.is_dir():
-                continue
-            
-            game_json = game_dir / "game.json"
-            if not game_json.exists():
-                continue
-            
-            try:
-                with open(game_json, 'r') as f:
-                    metadata = json.load(f)
-                    games.append({
-                        "path": game_dir,
-                        "metadata": metadata,
-                        "name": metadata.get("name", game_dir.name)
-                    })
-            except json.JSONDecodeError:
-                print(f"⚠️  Invalid game.json in {game_dir.name}")
-        
-        return sorted(games, key=lambda x: x["name"].lower())
+        Pass fields to keep only those keys of each game.json in memory.
+        """
+        with os.scandir(self.games_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                
+                game_dir = Path(entry.path)
+                try:
+                    metadata = self._read_game_fields(game_dir / "game.json", fields)
+                except FileNotFoundError:
+                    continue
+                except json.JSONDecodeError:
+                    print(f"⚠️  Invalid game.json in {game_dir.name}")
+                    continue
+                
+                yield {
+                    "path": game_dir,
+                    "metadata": metadata,
+                    "name": metadata.get("name", game_dir.name)
+                }
     
-    def _find_game(self, identifier: str) -> Optional[Dict]:
-        """Find game by name or index"""
+    def _get_all_games(self, fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """Get list of all games with their metadata, sorted by name
+        
+        The list is reused until the games directory's mtime moves (a game was
+        added or removed) or _forget_games() is called, so helpers within one
+        command share a single walk. Callers must not modify it.
+        """
+        token = os.stat(self.games_dir).st_mtime_ns
+        cached = self._games_cache
+        if cached is not None and cached[0] == fields and cached[1] == token:
+            return cached[2]
+        
+        games = sorted(self._iter_games(fields), key=_game_sort_key)
+        self._games_cache = (fields, token, games)
+        return games
+    
+    def _forget_games(self):
+        """Drop the cached game list and indexes after an install or uninstall"""
+        self._games_cache = None
+        self._game_index = None
+        self._zip_index = None
+    
+    def _build_game_index(self) -> Tuple[List[Dict], Dict[str, Dict], Dict[str, Dict]]:
+        """Index installed games by list position, lowercase name and slug
+        
+        The index is rebuilt only when _get_all_games() hands back a new list.
+        """
         games = self._get_all_games()
+        if self._game_index is None or self._game_index[0] is not games:
+            by_name = {}
+            for game in games:
+                by_name.setdefault(game["name"].lower(), game)
+            by_slug = {game["path"].name: game for game in games}
+            self._game_index = (games, by_name, by_slug)
+        
+        return self._game_index
+    
+    def _read_game(self, slug: str) -> Optional[Dict]:
+        """Read a single installed game straight from its directory, if there is one"""
+        if not slug or slug in (".", "..") or os.path.basename(slug) != slug:
+            return None
         
-        # Try as index
+        game_dir = self.games_dir / slug
+        try:
+            metadata = self._read_game_fields(game_dir / "game.json")
+        except (OSError, json.JSONDecodeError):
+            return None
+        
+        return {
+            "path": game_dir,
+            "metadata": metadata,
+            "name": metadata.get("name", game_dir.name)
+        }
+    
+    def _find_game(self, identifier: str) -> Optional[Dict]:
+        """Find game by name or index"""
         try:
             idx = int(identifier) - 1
-            if 0 <= idx < len(games):
-                return games[idx]
         except ValueError:
-            pass
+            idx = None
+            
+            # An exact slug names the game's directory - no need to read them all
+            game = self._read_game(identifier)
+            if game:
+                return game
         
-        # Try as name (case-insensitive partial match)
+        games, by_name, by_slug = self._build_game_index()
+        
+        # Try as index
+        if idx is not None and 0 <= idx < len(games):
+            return games[idx]
+        
+        # Try exact name or slug
         identifier_lower = identifier.lower()
-        for game in games:
-            if identifier_lower in game["name"].lower():
+        game = by_name.get(identifier_lower) or by_slug.get(identifier)
+        if game:
+            return game
+        
+        # Try as name (case-insensitive partial match). by_name keeps the first
+        # game for each lowercase name, in list order, so nothing is lowered here
+        for name_lower, game in by_name.items():
+            if identifier_lower in name_lower:
                 return game
         
         return None
@@ -182,7 +530,8 @@ class ClvibeManager:
         game_path = game["path"]
         
         # Check runtime availability
-        if not self._check_runtime(lang):
+        executable = self._resolve_runtime(lang)
+        if executable is None:
             runtime_cmd = self.runtimes.get(lang, {}).get("cmd", lang)
             print(f"❌ Runtime not available: {runtime_cmd}")
             print(f"Please install {lang} to play this game.")
@@ -208,8 +557,9 @@ class ClvibeManager:
         print("=" * 60)
         
         try:
+            # Launch the executable found above rather than searching PATH again
             subprocess.run(
-                [runtime["cmd"], str(main_file)],
+                [executable, str(main_file)],
                 cwd=str(game_path)
             )
         except KeyboardInterrupt:
@@ -242,21 +592,10 @@ class ClvibeManager:
                 print(f"❌ Not a valid zip file")
                 return
             
-            # Check if it's a collection (2+ game.json files)
-            is_collection = self._is_collection_zip(source)
-            
-            if force_collection or is_collection:
-                if is_collection:
-                    print(f"📦 Detected collection (multiple games found)")
-                else:
-                    print(f"📦 Installing as collection (forced)")
-                self._install_collection_from_zip(source)
-            else:
-                print(f"📦 Installing single game")
-                self._install_from_zip(source)
+            self._install_zip(source, force_collection=force_collection)
         elif source.is_dir():
             # Check if directory contains multiple games (collection)
-            game_jsons = list(source.rglob("game.json"))
+            game_jsons = list(_iter_game_jsons(source))
             
             if len(game_jsons) > 1:
                 print(f"📦 Detected collection with {len(game_jsons)} game(s)")
@@ -274,10 +613,8 @@ class ClvibeManager:
         else:
             print("❌ Source must be a directory, .zip file, or URL")
     
-    def _install_from_url(self, url: str, force_collection: bool = False):
-        """Download and install game from URL"""
-        print(f"🌐 Downloading from: {url}")
-        
+    def _download_target(self, url: str) -> Tuple[str, Path]:
+        """Work out the filename for a URL and reserve a unique temp file for it"""
         # Parse filename from URL
         parsed_url = urllib.parse.urlparse(url)
         filename = Path(parsed_url.path).name
@@ -289,23 +626,79 @@ class ClvibeManager:
         if not filename.endswith('.zip'):
             filename += '.zip'
         
-        # Download to temp directory
+        # Download to temp directory, under a name no concurrent download shares
         temp_dir = self.home_dir / "temp_downloads"
         temp_dir.mkdir(exist_ok=True)
-        temp_file = temp_dir / filename
+        fd, temp_name = tempfile.mkstemp(suffix=f"-{filename}", dir=temp_dir)
+        os.close(fd)
         
-        try:
-            # Download with progress indication
-            def report_progress(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = min(downloaded * 100 / total_size, 100)
-                    mb_downloaded = downloaded / (1024 * 1024)
-                    mb_total = total_size / (1024 * 1024)
-                    print(f"\r📥 Progress: {percent:.1f}% ({mb_downloaded:.2f}/{mb_total:.2f} MB)", end='', flush=True)
+        return filename, Path(temp_name)
+    
+    def _download(self, url: str, temp_file: Path, show_progress: bool = True,
+                  stop: Optional[threading.Event] = None):
+        """Download url into temp_file, giving up early once stop is set"""
+        with urllib.request.urlopen(url) as response, open(temp_file, 'wb') as out:
+            total_size = int(response.headers.get("Content-Length") or 0)
+            downloaded = 0
+            last_report = 0.0
             
-            urllib.request.urlretrieve(url, temp_file, reporthook=report_progress)
+            while stop is None or not stop.is_set():
+                chunk = response.read(_DOWNLOAD_CHUNK)
+                if not chunk:
+                    break
+                out.write(chunk)
+                downloaded += len(chunk)
+                
+                # Progress indication, throttled so terminal writes stay cheap
+                if show_progress and total_size > 0:
+                    now = time.monotonic()
+                    if now - last_report >= _PROGRESS_INTERVAL or downloaded >= total_size:
+                        last_report = now
+                        percent = min(downloaded * 100 / total_size, 100)
+                        mb_downloaded = downloaded / (1024 * 1024)
+                        mb_total = total_size / (1024 * 1024)
+                        sys.stdout.write(f"\r📥 Progress: {percent:.1f}% ({mb_downloaded:.2f}/{mb_total:.2f} MB)")
+                        sys.stdout.flush()
+        
+        if show_progress:
             print()  # New line after progress
+    
+    def _prefetch(self, pool: ThreadPoolExecutor, url: str,
+                  stop: threading.Event) -> Tuple[str, Path, Future]:
+        """Start downloading url in the background, without progress output"""
+        filename, temp_file = self._download_target(url)
+        return filename, temp_file, pool.submit(self._download, url, temp_file, False, stop)
+    
+    def _remove_download(self, temp_file: Path):
+        """Delete a temp download, and the temp directory once it is empty"""
+        if temp_file.exists():
+            temp_file.unlink()
+        try:
+            temp_file.parent.rmdir()
+        except OSError:
+            pass  # Missing, or still holds another download
+    
+    def _install_from_url(self, url: str, force_collection: bool = False,
+                          prefetched: Optional[Tuple[str, Path, Future]] = None):
+        """Download and install game from URL
+        
+        prefetched is the result of _prefetch() when the download is already
+        running in the background.
+        """
+        print(f"🌐 Downloading from: {url}")
+        
+        if prefetched:
+            filename, temp_file, download = prefetched
+        else:
+            filename, temp_file = self._download_target(url)
+        
+        try:
+            if prefetched:
+                if not download.done():
+                    print("⏳ Waiting for the download to finish...")
+                download.result()  # Re-raises any download error here
+            else:
+                self._download(url, temp_file)
             
             file_size_mb = temp_file.stat().st_size / (1024 * 1024)
             print(f"✅ Downloaded: {filename} ({file_size_mb:.2f} MB)")
@@ -316,18 +709,7 @@ class ClvibeManager:
                 temp_file.unlink()
                 return
             
-            # Check if it's a collection (2+ game.json files)
-            is_collection = self._is_collection_zip(temp_file)
-            
-            if force_collection or is_collection:
-                if is_collection:
-                    print(f"📦 Detected collection (multiple games found)")
-                else:
-                    print(f"📦 Installing as collection (forced)")
-                self._install_collection_from_zip(temp_file)
-            else:
-                print(f"📦 Installing single game")
-                self._install_from_zip(temp_file)
+            self._install_zip(temp_file, force_collection=force_collection)
             
         except urllib.error.HTTPError as e:
             print(f"\n❌ HTTP Error {e.code}: {e.reason}")
@@ -338,179 +720,333 @@ class ClvibeManager:
         except Exception as e:
             print(f"\n❌ Download failed: {e}")
         finally:
-            # Clean up temp file
-            if temp_file.exists():
-                temp_file.unlink()
-            # Clean up temp directory if empty
-            if temp_dir.exists() and not any(temp_dir.iterdir()):
-                temp_dir.rmdir()
+            # Clean up temp file, and the temp directory if empty
+            self._remove_download(temp_file)
     
-    def _get_unique_slug(self, base_slug: str, metadata: Dict) -> str:
-        """Generate a unique slug, considering author and version if needed"""
+    def _existing_slugs(self) -> Set[str]:
+        """Snapshot the names in the games directory with a single listing"""
+        with os.scandir(self.games_dir) as entries:
+            return {entry.name for entry in entries}
+    
+    def _get_unique_slug(self, base_slug: str, metadata: Dict,
+                         existing: Optional[Set[str]] = None) -> str:
+        """Generate a unique slug, considering author and version if needed
+        
+        existing is a snapshot from _existing_slugs(); batch installs share one
+        so collisions are checked in memory instead of stat'ing each candidate.
+        """
+        if existing is None:
+            existing = self._existing_slugs()
+        
         slug = base_slug
         dest_dir = self.games_dir / slug
         
         # If no collision, use base slug
-        if not dest_dir.exists():
+        if slug not in existing:
             return slug
         
         # Check if it's the exact same game (same author + version)
-        existing_json = dest_dir / "game.json"
-        if existing_json.exists():
-            try:
-                with open(existing_json, 'r') as f:
-                    existing_meta = json.load(f)
-                
-                # Same author and version = update
-                if (existing_meta.get("author") == metadata.get("author") and
-                    existing_meta.get("version") == metadata.get("version")):
-                    return slug
-            except json.JSONDecodeError:
-                pass
+        try:
+            existing_meta = _load_json((dest_dir / "game.json").read_bytes())
+            
+            # Same author and version = update
+            if (existing_meta.get("author") == metadata.get("author") and
+                existing_meta.get("version") == metadata.get("version")):
+                return slug
+        except (OSError, json.JSONDecodeError):
+            pass
         
         # Different game with same name - add author suffix
         author = metadata.get("author", "unknown")
-        author_slug = author.lower().replace(" ", "-")[:20]  # Limit length
+        author_slug = _slugify(author)[:20]  # Limit length
         slug_with_author = f"{base_slug}-by-{author_slug}"
         
-        if not (self.games_dir / slug_with_author).exists():
+        if slug_with_author not in existing:
             return slug_with_author
         
         # Still collision - add version
-        version = metadata.get("version", "1.0").replace(".", "")
+        version = metadata.get("version", "1.0").translate(_VERSION_SLUG_TABLE)
         slug_with_version = f"{slug_with_author}-v{version}"
         
-        if not (self.games_dir / slug_with_version).exists():
+        if slug_with_version not in existing:
             return slug_with_version
         
         # Last resort - add number suffix
         counter = 2
-        while (self.games_dir / f"{slug_with_version}-{counter}").exists():
+        while f"{slug_with_version}-{counter}" in existing:
             counter += 1
         
         return f"{slug_with_version}-{counter}"
     
     def _install_from_directory(self, source_dir: Path):
         """Install game from directory"""
-        game_json = source_dir / "game.json"
-        
-        if not game_json.exists():
-            print(f"❌ No game.json found in {source_dir}")
+        prepared = self._prepare_directory_install(source_dir, self._existing_slugs())
+        if prepared is None:
             return
+        game_name, slug = prepared
         
+        zip_path = self.zipped_dir / f"{slug}.zip"
+        _copy_game(source_dir, self.games_dir / slug, zip_path)
+        self._forget_games()
+        print(f"✅ Installed: {game_name}")
+        print(f"📦 Backed up to: {zip_path}")
+    
+    def _prepare_directory_install(self, source_dir: Path, existing: Set[str],
+                                   pending: Optional[Dict[str, Future]] = None
+                                   ) -> Optional[Tuple[str, str]]:
+        """Pick the slug for a game directory, asking before overwriting an install
+        
+        Returns (game_name, slug), or None if nothing should be installed. The
+        slug is added to existing and any install being replaced is removed.
+        pending maps slugs to copies still running in a collection install.
+        """
         try:
-            with open(game_json, 'r') as f:
-                metadata = json.load(f)
+            metadata = _load_json((source_dir / "game.json").read_bytes())
+        except FileNotFoundError:
+            print(f"❌ No game.json found in {source_dir}")
+            return None
         except json.JSONDecodeError:
             print("❌ Invalid game.json format")
-            return
+            return None
         
         game_name = metadata.get("name", source_dir.name)
-        base_slug = game_name.lower().replace(" ", "-")
-        slug = self._get_unique_slug(base_slug, metadata)
-        dest_dir = self.games_dir / slug
+        base_slug = _slugify(game_name)
+        
+        # An earlier game of this collection may still be copying into base_slug,
+        # whose game.json decides between an update and a collision
+        if pending and base_slug in pending:
+            wait([pending.pop(base_slug)])
+        
+        slug = self._get_unique_slug(base_slug, metadata, existing)
         
-        # Check if updating existing game
-        if dest_dir.exists():
+        # Check if updating existing game (the slug is only taken on an update)
+        if slug in existing:
             print(f"⚠️  Updating existing game: {game_name}")
             response = input("Overwrite? [y/N]: ")
             if response.lower() != 'y':
                 print("Installation cancelled.")
-                return
-            shutil.rmtree(dest_dir)
+                return None
+            shutil.rmtree(self.games_dir / slug)
         elif slug != base_slug:
             print(f"ℹ️  Name collision detected. Installing as: {slug}")
         
-        shutil.copytree(source_dir, dest_dir)
-        print(f"✅ Installed: {game_name}")
-        
-        # Create zip backup
-        zip_path = self.zipped_dir / f"{slug}.zip"
-        self._create_zip(dest_dir, zip_path)
-        print(f"📦 Backed up to: {zip_path}")
+        existing.add(slug)
+        return game_name, slug
     
-    def _install_from_zip(self, zip_path: Path):
-        """Install single game from zip file (for zips with only 1 game.json)"""
-        # Extract to temporary location first to read metadata
-        temp_extract = self.home_dir / "temp_extract"
-        temp_extract.mkdir(exist_ok=True)
+    def _install_game_dirs(self, game_dirs: List[Path], game_names: List[str],
+                           move: bool = False):
+        """Install the games of a collection, copying and zipping them in parallel
         
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(temp_extract)
-            
-            # Find game.json (might be in subdirectory)
-            game_json = None
-            for root, dirs, files in os.walk(temp_extract):
-                if "game.json" in files:
-                    game_json = Path(root) / "game.json"
-                    break
-            
-            if not game_json:
-                print(f"❌ No game.json found in zip file")
-                return
-            
-            with open(game_json, 'r') as f:
-                metadata = json.load(f)
+        Prompts and slug choices are made one game at a time in this process;
+        the copies and backup zips run in a process pool meanwhile. move=True
+        is for throwaway sources (extracted collections).
+        """
+        successful = 0
+        failed = 0
+        existing = self._existing_slugs()
+        pending = {}  # slug -> copy still running
+        jobs = {}     # future -> (game name, zip path)
+        
+        # Games nested in one another are copied, so a move can't pull files
+        # out from under a copy running at the same time
+        game_dir_set = set(game_dirs)
+        nested = {parent for game_dir in game_dirs for parent in game_dir.parents
+                  if parent in game_dir_set}
+        
+        with ProcessPoolExecutor() as pool:
+            for i, game_dir in enumerate(game_dirs, 1):
+                name = game_names[i-1] if i-1 < len(game_names) else game_dir.name
+                print(f"[{i}/{len(game_dirs)}] Installing: {name}")
+                try:
+                    prepared = self._prepare_directory_install(game_dir, existing, pending)
+                except Exception as e:
+                    print(f"  ❌ Failed: {e}")
+                    failed += 1
+                    print()
+                    continue
+                print()
+                if prepared is None:
+                    successful += 1
+                    continue
+                game_name, slug = prepared
+                
+                zip_path = self.zipped_dir / f"{slug}.zip"
+                game_move = (move and game_dir not in nested
+                             and game_dir_set.isdisjoint(game_dir.parents))
+                future = pool.submit(_copy_game, game_dir, self.games_dir / slug,
+                                     zip_path, game_move)
+                pending[slug] = future
+                jobs[future] = (game_name, zip_path)
             
-            game_name = metadata.get("name", zip_path.stem)
-            base_slug = game_name.lower().replace(" ", "-")
-            slug = self._get_unique_slug(base_slug, metadata)
+            for future in as_completed(jobs):
+                game_name, zip_path = jobs[future]
+                error = future.exception()
+                if error is None:
+                    print(f"✅ Installed: {game_name}")
+                    print(f"📦 Backed up to: {zip_path}")
+                    successful += 1
+                else:
+                    print(f"❌ Failed: {game_name}: {error}")
+                    failed += 1
+        
+        if jobs:
+            self._forget_games()
+            print()
+        print("=" * 60)
+        print(f"✅ Successfully installed: {successful}")
+        if failed > 0:
+            print(f"❌ Failed: {failed}")
+        print()
+    
+    def _scan_zip(self, zip_path: Path
+                  ) -> Tuple[zipfile.ZipFile, List[zipfile.ZipInfo], List[str]]:
+        """Open a zip and return it with its safe-to-extract members and game.json names (unsafe members are dropped)"""
+        zf = zipfile.ZipFile(zip_path, 'r')
+        members = []
+        game_jsons = []
+        for info in zf.infolist():
+            name = info.filename
+            parts = name.split('/')
+            if name.startswith('/') or '..' in parts or os.path.splitdrive(name)[0]:
+                continue
+            members.append(info)
+            if parts[-1] == "game.json":
+                game_jsons.append(name)
+        return zf, members, game_jsons
+    
+    def _install_zip(self, zip_path: Path, force_collection: bool = False):
+        """Install a zip as a single game or a collection, reading it only once"""
+        zf, members, game_jsons = self._scan_zip(zip_path)
+        
+        with zf:
+            # Check if it's a collection (2+ game.json files)
+            is_collection = len(game_jsons) > 1
             
-            # Copy zip to zipped directory with proper name
-            dest_zip = self.zipped_dir / f"{slug}.zip"
+            if force_collection or is_collection:
+                if is_collection:
+                    print(f"📦 Detected collection (multiple games found)")
+                else:
+                    print(f"📦 Installing as collection (forced)")
+                self._install_collection_from_zip(zf, members, game_jsons)
+            else:
+                print(f"📦 Installing single game")
+                self._install_from_zip(zip_path, zf, members, game_jsons)
+    
+    def _install_from_zip(self, zip_path: Path, zf: Optional[zipfile.ZipFile] = None,
+                          members: Optional[List[zipfile.ZipInfo]] = None,
+                          game_jsons: Optional[List[str]] = None):
+        """Install single game from zip file (for zips with only 1 game.json)"""
+        if zf is None:
+            zf, members, game_jsons = self._scan_zip(zip_path)
+            with zf:
+                return self._install_from_zip(zip_path, zf, members, game_jsons)
+        
+        if not game_jsons:
+            print(f"❌ No game.json found in zip file")
+            return
+        
+        # Read metadata straight from the archive, no extraction needed
+        game_json = game_jsons[0]
+        metadata = _load_json(zf.read(game_json))
+        
+        game_name = metadata.get("name", zip_path.stem)
+        base_slug = _slugify(game_name)
+        existing = self._existing_slugs()
+        slug = self._get_unique_slug(base_slug, metadata, existing)
+        
+        # Copy zip to zipped directory with proper name (a restore may already be it)
+        dest_zip = self.zipped_dir / f"{slug}.zip"
+        stored = dest_zip.exists() and os.path.samefile(zip_path, dest_zip)
+        if not stored:
             shutil.copy2(zip_path, dest_zip)
             print(f"📦 Stored zip: {dest_zip.name}")
-            
-            # Extract to games directory
-            extract_dir = self.games_dir / slug
-            
-            # Check if updating existing game
-            if extract_dir.exists():
-                print(f"⚠️  Updating existing game: {game_name}")
-                response = input("Overwrite? [y/N]: ")
-                if response.lower() != 'y':
-                    print("Installation cancelled.")
+        
+        # Extract to games directory
+        extract_dir = self.games_dir / slug
+        
+        # Check if updating existing game (the slug is only taken on an update)
+        if slug in existing:
+            print(f"⚠️  Updating existing game: {game_name}")
+            response = input("Overwrite? [y/N]: ")
+            if response.lower() != 'y':
+                print("Installation cancelled.")
+                if not stored:
                     dest_zip.unlink()  # Remove copied zip
-                    return
-                shutil.rmtree(extract_dir)
-            elif slug != base_slug:
-                print(f"ℹ️  Name collision detected. Installing as: {slug}")
-            
-            # Move from temp to final location
-            game_source = game_json.parent
-            shutil.move(str(game_source), str(extract_dir))
-            
-            print(f"✅ Installed: {game_name}")
-            
+                return
+            shutil.rmtree(extract_dir)
+        elif slug != base_slug:
+            print(f"ℹ️  Name collision detected. Installing as: {slug}")
+        
+        # Extract the directory holding game.json directly into place
+        prefix = game_json[:-len("game.json")]
+        try:
+            self._extract_game(zf, members, prefix, extract_dir)
+        except BaseException:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            raise
         finally:
-            # Clean up temp directory
-            if temp_extract.exists():
-                shutil.rmtree(temp_extract)
+            self._forget_games()
+        
+        print(f"✅ Installed: {game_name}")
     
-    def _is_collection_zip(self, zip_path: Path) -> bool:
-        """Check if zip contains multiple games (collection)"""
-        game_json_count = 0
+    def _extract_game(self, zf: zipfile.ZipFile, members: List[zipfile.ZipInfo],
+                      prefix: str, dest_dir: Path):
+        """Extract the members under prefix into dest_dir, with prefix stripped
         
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                for name in zf.namelist():
-                    if name.endswith('game.json'):
-                        game_json_count += 1
-                        if game_json_count > 1:
-                            return True
-        except Exception:
-            return False
+        members must already be sanitized (see _scan_zip). Files are
+        decompressed by a thread pool (zlib releases the GIL), each thread
+        reading through its own handle on the archive.
+        """
+        dest_dir.mkdir()
+        
+        # Work out every target first so all directories exist before any writes
+        dirs = set()
+        files = []
+        for info in members:
+            if not info.filename.startswith(prefix):
+                continue
+            
+            relative = info.filename[len(prefix):]
+            if not relative:
+                continue
+            
+            target = dest_dir.joinpath(*relative.split('/'))
+            if info.is_dir():
+                dirs.add(target)
+            else:
+                dirs.add(target.parent)
+                files.append((info, target))
         
-        return False
+        for directory in dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        # Start the big members first so they don't hold up the end of the run
+        files.sort(key=lambda job: job[0].compress_size, reverse=True)
+        
+        local = threading.local()
+        handles = []
+        
+        def extract(job):
+            info, target = job
+            handle = getattr(local, "zf", None)
+            if handle is None:
+                handle = local.zf = zipfile.ZipFile(zf.filename, 'r')
+                handles.append(handle)
+            with handle.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, _ZIP_BUFFER)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                for _ in pool.map(extract, files):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
     
     def _install_collection_from_directory(self, source_dir: Path):
         """Install multiple games from a directory containing multiple game.json files"""
         # Find all game directories
-        game_dirs = []
-        for root, dirs, files in os.walk(source_dir):
-            if "game.json" in files:
-                game_dirs.append(Path(root))
+        game_dirs = [game_json.parent for game_json in _iter_game_jsons(source_dir)]
         
         if not game_dirs:
             print(f"❌ No games found in directory")
@@ -522,11 +1058,10 @@ class ClvibeManager:
         game_names = []
         for game_dir in game_dirs:
             try:
-                with open(game_dir / "game.json", 'r') as f:
-                    metadata = json.load(f)
-                    name = metadata.get("name", game_dir.name)
-                    game_names.append(name)
-                    print(f"  • {name}")
+                metadata = _load_json((game_dir / "game.json").read_bytes())
+                name = metadata.get("name", game_dir.name)
+                game_names.append(name)
+                print(f"  • {name}")
             except Exception:
                 print(f"  • {game_dir.name} (could not read metadata)")
         
@@ -538,42 +1073,23 @@ class ClvibeManager:
             return
         
         print()
-        successful = 0
-        failed = 0
-        
-        # Install each game
-        for i, game_dir in enumerate(game_dirs, 1):
-            name = game_names[i-1] if i-1 < len(game_names) else game_dir.name
-            print(f"[{i}/{len(game_dirs)}] Installing: {name}")
-            try:
-                self._install_from_directory(game_dir)
-                successful += 1
-            except Exception as e:
-                print(f"  ❌ Failed: {e}")
-                failed += 1
-            print()
-        
-        print("=" * 60)
-        print(f"✅ Successfully installed: {successful}")
-        if failed > 0:
-            print(f"❌ Failed: {failed}")
-        print()
+        self._install_game_dirs(game_dirs, game_names)
     
-    def _install_collection_from_zip(self, zip_path: Path):
+    def _install_collection_from_zip(self, zf: zipfile.ZipFile,
+                                     members: List[zipfile.ZipInfo], game_jsons: List[str]):
         """Install multiple games from a collection zip file"""
         temp_extract = self.home_dir / "temp_collection"
         
         try:
-            # Extract collection
+            # Extract collection on the same thread pool as single games,
+            # clearing anything left over from an interrupted run first
             print(f"📂 Extracting collection...")
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(temp_extract)
+            if temp_extract.exists():
+                shutil.rmtree(temp_extract)
+            self._extract_game(zf, members, "", temp_extract)
             
-            # Find all game directories
-            game_dirs = []
-            for root, dirs, files in os.walk(temp_extract):
-                if "game.json" in files:
-                    game_dirs.append(Path(root))
+            # Game directories are already known from the zip listing
+            game_dirs = [(temp_extract / name).parent for name in game_jsons]
             
             if not game_dirs:
                 print(f"❌ No games found in collection")
@@ -585,11 +1101,10 @@ class ClvibeManager:
             game_names = []
             for game_dir in game_dirs:
                 try:
-                    with open(game_dir / "game.json", 'r') as f:
-                        metadata = json.load(f)
-                        name = metadata.get("name", game_dir.name)
-                        game_names.append(name)
-                        print(f"  • {name}")
+                    metadata = _load_json((game_dir / "game.json").read_bytes())
+                    name = metadata.get("name", game_dir.name)
+                    game_names.append(name)
+                    print(f"  • {name}")
                 except Exception:
                     print(f"  • {game_dir.name} (could not read metadata)")
             
@@ -601,26 +1116,8 @@ class ClvibeManager:
                 return
             
             print()
-            successful = 0
-            failed = 0
-            
-            # Install each game
-            for i, game_dir in enumerate(game_dirs, 1):
-                name = game_names[i-1] if i-1 < len(game_names) else game_dir.name
-                print(f"[{i}/{len(game_dirs)}] Installing: {name}")
-                try:
-                    self._install_from_directory(game_dir)
-                    successful += 1
-                except Exception as e:
-                    print(f"  ❌ Failed: {e}")
-                    failed += 1
-                print()
-            
-            print("=" * 60)
-            print(f"✅ Successfully installed: {successful}")
-            if failed > 0:
-                print(f"❌ Failed: {failed}")
-            print()
+            # The extraction is thrown away afterwards, so games can be moved out of it
+            self._install_game_dirs(game_dirs, game_names, move=True)
             
         finally:
             # Clean up temp extraction
@@ -643,15 +1140,16 @@ class ClvibeManager:
         
         games_found = []
         
-        if zipped:
-            # Install from zip files
-            for zip_file in source.glob("*.zip"):
-                games_found.append(zip_file)
-        else:
-            # Install from directories with game.json
-            for item in source.iterdir():
-                if item.is_dir() and (item / "game.json").exists():
-                    games_found.append(item)
+        # One pass over the directory; DirEntry types come from readdir itself
+        with os.scandir(source) as it:
+            for entry in it:
+                if zipped:
+                    # Install from zip files
+                    if entry.name.endswith(".zip") and entry.is_file():
+                        games_found.append(Path(entry.path))
+                elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, "game.json")):
+                    # Install from directories with game.json
+                    games_found.append(Path(entry.path))
         
         if not games_found:
             file_type = "zip files" if zipped else "game directories"
@@ -721,15 +1219,34 @@ class ClvibeManager:
         successful = 0
         failed = 0
         
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing: {url}")
-            print("-" * 60)
+        # Download the next URL in the background while the current one installs.
+        # unclaimed holds prefetches not yet handed to _install_from_url.
+        stop = threading.Event()
+        unclaimed = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
             try:
-                self._install_from_url(url)
-                successful += 1
-            except Exception as e:
-                print(f"❌ Failed: {e}")
-                failed += 1
+                unclaimed.append(self._prefetch(pool, urls[0], stop))
+                
+                for i, url in enumerate(urls, 1):
+                    if i < len(urls):
+                        unclaimed.append(self._prefetch(pool, urls[i], stop))
+                    download = unclaimed.pop(0)
+                    
+                    print(f"\n[{i}/{len(urls)}] Processing: {url}")
+                    print("-" * 60)
+                    try:
+                        self._install_from_url(url, prefetched=download)
+                        successful += 1
+                    except Exception as e:
+                        print(f"❌ Failed: {e}")
+                        failed += 1
+            finally:
+                # Left early (Ctrl-C at a prompt, an error): stop background
+                # downloads so the pool can shut down, and remove their files
+                stop.set()
+                for _, temp_file, future in unclaimed:
+                    wait([future])
+                    self._remove_download(temp_file)
         
         print("\n" + "=" * 60)
         print(f"✅ Successfully installed: {successful}")
@@ -753,28 +1270,36 @@ class ClvibeManager:
         successful = 0
         failed = 0
         
-        for game in games:
-            game_name = game["name"]
-            slug = game_name.lower().replace(" ", "-")
+        if zipped:
+            # Export as zips, compressed in parallel. Installed slugs are
+            # unique, so no two workers ever write the same archive.
+            exports = {output / f"{game['path'].name}.zip": game for game in games}
+            jobs = {zip_path: game["path"] for zip_path, game in exports.items()}
             
-            try:
-                if zipped:
-                    # Export as zip
-                    zip_path = output / f"{slug}.zip"
-                    self._create_zip(game["path"], zip_path)
-                    print(f"✅ {game_name} → {zip_path.name}")
+            for zip_path, error in self._create_zips(jobs):
+                game_name = exports[zip_path]["name"]
+                if error:
+                    print(f"❌ {game_name}: {error}")
+                    failed += 1
                 else:
+                    print(f"✅ {game_name} → {zip_path.name}")
+                    successful += 1
+        else:
+            for game in games:
+                game_name = game["name"]
+                slug = game["path"].name
+                
+                try:
                     # Copy directory
                     dest_dir = output / slug
                     if dest_dir.exists():
                         shutil.rmtree(dest_dir)
-                    shutil.copytree(game["path"], dest_dir)
+                    shutil.copytree(game["path"], dest_dir, copy_function=_reflink_or_copy)
                     print(f"✅ {game_name} → {dest_dir.name}/")
-                
-                successful += 1
-            except Exception as e:
-                print(f"❌ {game_name}: {e}")
-                failed += 1
+                    successful += 1
+                except Exception as e:
+                    print(f"❌ {game_name}: {e}")
+                    failed += 1
         
         print()
         print("=" * 50)
@@ -793,7 +1318,7 @@ class ClvibeManager:
             return
         
         if not output_path:
-            slug = game["name"].lower().replace(" ", "-")
+            slug = _slugify(game["name"])
             output_path = f"{slug}.zip"
         
         output = Path(output_path)
@@ -802,10 +1327,18 @@ class ClvibeManager:
     
     def _create_zip(self, source_dir: Path, zip_path: Path):
         """Create a zip file from directory"""
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file in source_dir.rglob('*'):
-                if file.is_file():
-                    zf.write(file, file.relative_to(source_dir))
+        _zip_directory(source_dir, zip_path)
+    
+    def _create_zips(self, jobs: Dict[Path, Path]) -> Iterator[Tuple[Path, Optional[BaseException]]]:
+        """Create zips in parallel from {zip_path: source_dir}, yielding (zip_path, error) as each finishes"""
+        # DEFLATE is CPU-bound, so compress each archive in its own process
+        with ProcessPoolExecutor() as pool:
+            futures = {
+                pool.submit(_zip_directory, source_dir, zip_path): zip_path
+                for zip_path, source_dir in jobs.items()
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.exception()
     
     def uninstall_game(self, identifier: str):
         """Uninstall a game"""
@@ -818,11 +1351,12 @@ class ClvibeManager:
         game_name = game["name"]
         slug = game["path"].name
         zip_path = self.zipped_dir / f"{slug}.zip"
+        zip_exists = zip_path.is_file()
         
         # Show what will be deleted
         print(f"Game: {game_name}")
         print(f"Path: {game['path']}")
-        if zip_path.exists():
+        if zip_exists:
             print(f"Backup: {zip_path}")
         
         # Confirm deletion
@@ -833,24 +1367,61 @@ class ClvibeManager:
             return
         
         # Remove game directory
-        shutil.rmtree(game["path"])
+        _fast_rmtree(game["path"])
+        self._forget_games()
         print(f"✅ Removed game files")
         
         # Ask about zip backup
-        if zip_path.exists():
+        if zip_exists:
             response = input(f"Also delete zip backup? [y/N]: ")
             if response.lower() == 'y':
-                zip_path.unlink()
+                try:
+                    zip_path.unlink()
+                except FileNotFoundError:
+                    pass
                 print(f"✅ Removed backup")
             else:
                 print(f"💾 Kept backup: {zip_path}")
         
         print(f"\n✅ Uninstalled: {game_name}")
     
+    def _iter_zip_entries(self) -> Iterator[os.DirEntry]:
+        """Yield DirEntry objects for the zip backups with one scandir pass"""
+        with os.scandir(self.zipped_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".zip") and entry.is_file():
+                    yield entry
+    
+    def _iter_zips(self) -> Iterator[Path]:
+        """Yield the zip backups (no glob pattern matching)"""
+        for entry in self._iter_zip_entries():
+            yield Path(entry.path)
+    
+    def _get_zip_index(self) -> List[Tuple[str, Path]]:
+        """(lowercase stem, path) for each zip backup, sorted by path
+        
+        Rebuilt only when the zipped directory's mtime moves (or after
+        _forget_games()), so name searches don't lower every stem each time.
+        """
+        token = os.stat(self.zipped_dir).st_mtime_ns
+        if self._zip_index is None or self._zip_index[0] != token:
+            zips = sorted(self._iter_zips())
+            self._zip_index = (token, [(zip_file.stem.lower(), zip_file) for zip_file in zips])
+        return self._zip_index[1]
+    
     def restore_from_zip(self, identifier: str):
         """Restore a game from its zip backup"""
-        # Find zip file
-        zip_files = list(self.zipped_dir.glob("*.zip"))
+        # An exact slug names the zip directly - no need to list them all
+        direct = self.zipped_dir / f"{identifier}.zip"
+        if (not identifier.isdigit() and os.path.basename(identifier) == identifier
+                and direct.is_file()):
+            print(f"📦 Restoring from: {direct.name}")
+            self._install_from_zip(direct)
+            return
+        
+        # Find zip file (sorted, in the order list-zipped numbers them)
+        zip_index = self._get_zip_index()
+        zip_files = [zip_file for _, zip_file in zip_index]
         
         if not zip_files:
             print("❌ No zip backups found.")
@@ -862,19 +1433,19 @@ class ClvibeManager:
         try:
             idx = int(identifier) - 1
             if 0 <= idx < len(zip_files):
-                selected_zip = sorted(zip_files)[idx]
+                selected_zip = zip_files[idx]
         except ValueError:
             # Search by name
             identifier_lower = identifier.lower()
-            for zip_file in zip_files:
-                if identifier_lower in zip_file.stem.lower():
+            for stem_lower, zip_file in zip_index:
+                if identifier_lower in stem_lower:
                     selected_zip = zip_file
                     break
         
         if not selected_zip:
             print(f"❌ Zip backup '{identifier}' not found.")
             print("\nAvailable backups:")
-            for i, zf in enumerate(sorted(zip_files), 1):
+            for i, zf in enumerate(zip_files, 1):
                 print(f"  [{i}] {zf.stem}")
             return
         
@@ -883,7 +1454,10 @@ class ClvibeManager:
     
     def list_zipped(self):
         """List all zip backups"""
-        zip_files = sorted(self.zipped_dir.glob("*.zip"))
+        # (slug, size) pairs, stat'ed once each through the DirEntry. Sorted by
+        # full file name, as restore numbers them ("a-b.zip" before "a.zip")
+        entries = sorted(self._iter_zip_entries(), key=lambda entry: entry.name)
+        zip_files = [(entry.name[:-len(".zip")], entry.stat().st_size) for entry in entries]
         
         if not zip_files:
             print("📦 No zip backups found.")
@@ -893,33 +1467,37 @@ class ClvibeManager:
         
         installed_games = {g["path"].name for g in self._get_all_games()}
         
-        for idx, zip_file in enumerate(zip_files, 1):
-            slug = zip_file.stem
+        for idx, (slug, size) in enumerate(zip_files, 1):
             installed = "✓" if slug in installed_games else " "
-            size_mb = zip_file.stat().st_size / (1024 * 1024)
+            size_mb = size / (1024 * 1024)
             
-            print(f"  [{idx}] {installed} {zip_file.stem} ({size_mb:.2f} MB)")
+            print(f"  [{idx}] {installed} {slug} ({size_mb:.2f} MB)")
         
         print(f"\n✓ = Currently installed")
-        print(f"Total backup size: {sum(f.stat().st_size for f in zip_files) / (1024 * 1024):.2f} MB")
+        print(f"Total backup size: {sum(size for _, size in zip_files) / (1024 * 1024):.2f} MB")
     
     def sync_zips(self):
         """Sync zip backups - create missing zips, remove orphaned zips"""
         games = self._get_all_games()
-        zip_files = {zf.stem: zf for zf in self.zipped_dir.glob("*.zip")}
+        zip_files = {zf.stem: zf for zf in self._iter_zips()}
         
         print("🔄 Syncing zip backups...\n")
         
         created = 0
         removed = 0
         
-        # Create missing zips
-        for game in games:
-            slug = game["path"].name
-            if slug not in zip_files:
-                zip_path = self.zipped_dir / f"{slug}.zip"
-                self._create_zip(game["path"], zip_path)
-                print(f"📦 Created backup: {game['name']}")
+        # Create missing zips, compressed in parallel
+        missing = {
+            self.zipped_dir / f"{game['path'].name}.zip": game
+            for game in games if game["path"].name not in zip_files
+        }
+        jobs = {zip_path: game["path"] for zip_path, game in missing.items()}
+        for zip_path, error in self._create_zips(jobs):
+            game_name = missing[zip_path]["name"]
+            if error:
+                print(f"❌ Failed to back up {game_name}: {error}")
+            else:
+                print(f"📦 Created backup: {game_name}")
                 created += 1
         
         # Find orphaned zips (no corresponding game)
@@ -942,21 +1520,93 @@ class ClvibeManager:
         print(f"   Created: {created}")
         print(f"   Removed: {removed}")
     
-    def _compute_game_hash(self, game_json_path: Path) -> str:
-        """Compute a hash of the game.json content for duplicate detection"""
-        import hashlib
+    def _load_hash_cache(self) -> Dict[str, Dict[str, dict]]:
+        """Load the hash cache, starting empty if it's missing or unreadable
+        
+        It has two sections, each mapping a path to {"algo", "mtime", "size",
+        "hash"}: "metadata" for canonical game.json hashes and "files" for
+        the raw file digests behind tree hashes.
+        """
+        if self._hash_cache is None:
+            try:
+                cache = _load_json(self.hash_cache_file.read_bytes())
+            except (OSError, json.JSONDecodeError):
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+            self._hash_cache = {
+                section: cache.get(section) if isinstance(cache.get(section), dict) else {}
+                for section in ("metadata", "files")
+            }
+        return self._hash_cache
+    
+    def _save_hash_cache(self, slugs: Set[str]):
+        """Write the hash cache back, dropping entries outside the given games"""
+        prefix = os.path.join(str(self.games_dir), "")
+        
+        def kept(path):
+            return (path.startswith(prefix)
+                    and path[len(prefix):].split(os.sep, 1)[0] in slugs)
+        
+        cache = {
+            section: {path: entry for path, entry in entries.items() if kept(path)}
+            for section, entries in self._load_hash_cache().items()
+        }
+        self._hash_cache = cache
+        try:
+            self.hash_cache_file.write_text(json.dumps(cache))
+        except OSError:
+            pass  # Only a cache - the next run just rehashes
+    
+    def _compute_game_hash(self, game_json_path: Path,
+                           st: Optional[os.stat_result] = None) -> str:
+        """Compute a hash of the game.json content for duplicate detection
+        
+        Reuses the cached hash while the file's mtime and size are unchanged.
+        Pass st if the file has already been stat'ed.
+        """
+        cache = self._load_hash_cache()["metadata"]
+        key = str(game_json_path)
+        if st is None:
+            try:
+                st = game_json_path.stat()
+            except OSError:
+                return ""
+        
+        game_hash = _cached_hash(cache.get(key), st)
+        if game_hash:
+            return game_hash
+        
         try:
-            with open(game_json_path, 'r') as f:
-                # Sort keys to ensure consistent hashing
-                metadata = json.load(f)
-                # Create normalized string representation
-                normalized = json.dumps(metadata, sort_keys=True)
-                return hashlib.md5(normalized.encode()).hexdigest()
+            game_hash = _hasher(_canonical_json(game_json_path.read_bytes())).hexdigest()
         except Exception:
             return ""
+        
+        cache[key] = _hash_entry(game_hash, st)
+        return game_hash
+    
+    def _compute_tree_hash(self, game_dir: Path) -> str:
+        """Compute a Merkle root over every file in a game for duplicate detection
+        
+        Each file's digest (cached by mtime and size) is combined with its
+        relative path and size, in path order, into a single root hash.
+        """
+        cache = self._load_hash_cache()["files"]
+        root = _hasher()
+        try:
+            for path, relpath in sorted(_iter_files(game_dir), key=lambda f: f[1]):
+                st = os.stat(path)
+                digest = _cached_hash(cache.get(path), st)
+                if not digest:
+                    digest = _hash_file(path)
+                    cache[path] = _hash_entry(digest, st)
+                root.update(f"{relpath.replace(os.sep, '/')}\0{st.st_size}\0{digest}\n".encode())
+        except OSError:
+            return ""
+        return root.hexdigest()
     
     def find_duplicates(self):
-        """Find and optionally remove duplicate games (identical game.json)"""
+        """Find and optionally remove duplicate games (identical game.json and files)"""
         games = self._get_all_games()
         
         if len(games) < 2:
@@ -965,19 +1615,49 @@ class ClvibeManager:
         
         print("🔍 Scanning for duplicate games...\n")
         
-        # Group games by their game.json hash
-        hash_to_games = {}
+        # Duplicates must have byte-identical files (the tree hash covers
+        # game.json too), so only games whose game.json sizes collide need hashing
+        stats = []
         for game in games:
-            game_json = game["path"] / "game.json"
-            game_hash = self._compute_game_hash(game_json)
+            try:
+                stats.append((game, (game["path"] / "game.json").stat()))
+            except OSError:
+                continue
+        size_counts = {}
+        for _, st in stats:
+            size_counts[st.st_size] = size_counts.get(st.st_size, 0) + 1
+        sized = [(game, st) for game, st in stats if size_counts[st.st_size] > 1]
+        
+        # Hashing is small reads plus C hashing that releases the GIL, so
+        # threads overlap it. Load the cache first so they all share it.
+        self._load_hash_cache()
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(sized)))) as pool:
+            # Group games by their game.json hash (map keeps the games in order)
+            hash_to_games = {}
+            game_hashes = pool.map(
+                lambda pair: self._compute_game_hash(pair[0]["path"] / "game.json", pair[1]),
+                sized)
+            for (game, _), game_hash in zip(sized, game_hashes):
+                if game_hash:
+                    if game_hash not in hash_to_games:
+                        hash_to_games[game_hash] = []
+                    hash_to_games[game_hash].append(game)
+            
+            # Matching metadata isn't enough - the files must match too. Only games
+            # sharing a game.json hash need their trees hashed.
+            candidates = [(game_hash, game) for game_hash, group in hash_to_games.items()
+                          if len(group) > 1 for game in group]
+            tree_hashes = pool.map(lambda candidate: self._compute_tree_hash(candidate[1]["path"]),
+                                   candidates)
             
-            if game_hash:
-                if game_hash not in hash_to_games:
-                    hash_to_games[game_hash] = []
-                hash_to_games[game_hash].append(game)
+            duplicates = {}
+            for (game_hash, game), tree_hash in zip(candidates, tree_hashes):
+                if tree_hash:
+                    duplicates.setdefault((game_hash, tree_hash), []).append(game)
+        
+        duplicates = {key: group for key, group in duplicates.items() if len(group) > 1}
         
-        # Find duplicates
-        duplicates = {h: g for h, g in hash_to_games.items() if len(g) > 1}
+        self._save_hash_cache({game["path"].name for game in games})
         
         if not duplicates:
             print("✅ No duplicate games found.")
@@ -1012,29 +1692,25 @@ class ClvibeManager:
         print()
         removed = 0
         
+        # Keep the first of each set; remove the rest's directories and zip
+        # backups (where they exist) with a single batched rm
+        victims = []
+        for dupe_games in duplicates.values():
+            for game in dupe_games[1:]:
+                victims.append(game["path"])
+                victims.append(self.zipped_dir / f"{game['path'].name}.zip")
+        _fast_rmtree(*victims)
+        self._forget_games()
+        
         for game_hash, dupe_games in duplicates.items():
             name = dupe_games[0]["metadata"].get("name", "Unknown")
-            
-            # Keep the first one, remove the rest
             keep = dupe_games[0]
-            to_remove = dupe_games[1:]
             
             print(f"📦 {name}")
             print(f"   Keeping: {keep['path'].name}")
             
-            for game in to_remove:
-                slug = game["path"].name
-                game_path = game["path"]
-                zip_path = self.zipped_dir / f"{slug}.zip"
-                
-                # Remove game directory
-                shutil.rmtree(game_path)
-                
-                # Remove zip backup if exists
-                if zip_path.exists():
-                    zip_path.unlink()
-                
-                print(f"   Removed: {slug}")
+            for game in dupe_games[1:]:
+                print(f"   Removed: {game['path'].name}")
                 removed += 1
             
             print()
@@ -1107,7 +1783,7 @@ class ClvibeManager:
         
         # Find script files for the detected/selected language
         ext = self.runtimes[lang]["ext"]
-        script_files = sorted([f for f in game_dir.rglob(f"*{ext}") if f.is_file()])
+        script_files = sorted(Path(path) for path, _ in _iter_files(game_dir) if path.endswith(ext))
         
         if not script_files:
             print(f"❌ No {ext} files found in directory")
@@ -1245,10 +1921,9 @@ class ClvibeManager:
         # Count files by extension
         ext_counts = {}
         
-        for file in directory.rglob("*"):
-            if file.is_file():
-                ext = file.suffix.lower()
-                ext_counts[ext] = ext_counts.get(ext, 0) + 1
+        for path, _ in _iter_files(directory):
+            ext = os.path.splitext(path)[1].lower()
+            ext_counts[ext] = ext_counts.get(ext, 0) + 1
         
         # Find which language has the most matching files
         lang_scores = {}